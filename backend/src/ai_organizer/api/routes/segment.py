@@ -31,6 +31,18 @@ def _scalar(val):
     return val
 
 
+def _ensure_document_owned(session: Session, document_id: int, user_id: int) -> None:
+    """
+    Ownership check χωρίς να φορτωθεί όλο το Document (text μπορεί να είναι MBs):
+    index-only probe στο id.
+    """
+    found = session.exec(
+        select(Document.id).where(Document.id == document_id, Document.user_id == user_id)
+    ).first()
+    if found is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+
 class ManualSegmentIn(BaseModel):
     mode: SegmentMode = SegmentMode.qa
     start: int
@@ -273,11 +285,7 @@ def list_segments(
         raise HTTPException(status_code=400, detail=f"Unknown mode: {mode}")
 
     with Session(engine) as session:
-        doc = session.exec(
-            select(Document).where(Document.id == document_id, Document.user_id == user.id)
-        ).first()
-        if not doc:
-            raise HTTPException(status_code=404, detail="Document not found")
+        _ensure_document_owned(session, document_id, user.id)
 
         stmt = select(Segment).where(Segment.document_id == document_id)
         meta_stmt = select(
@@ -375,11 +383,7 @@ def list_segmentations(
     user: User = Depends(get_current_user),
 ):
     with Session(engine) as session:
-        doc = session.exec(
-            select(Document).where(Document.id == document_id, Document.user_id == user.id)
-        ).first()
-        if not doc:
-            raise HTTPException(status_code=404, detail="Document not found")
+        _ensure_document_owned(session, document_id, user.id)
 
         rows = session.exec(
             select(
@@ -409,11 +413,7 @@ def delete_segments(
         raise HTTPException(status_code=400, detail=f"Unknown mode: {mode}")
 
     with Session(engine) as session:
-        doc = session.exec(
-            select(Document).where(Document.id == document_id, Document.user_id == user.id)
-        ).first()
-        if not doc:
-            raise HTTPException(status_code=404, detail="Document not found")
+        _ensure_document_owned(session, document_id, user.id)
 
         stmt = delete(Segment).where(Segment.document_id == document_id)
         if mode:
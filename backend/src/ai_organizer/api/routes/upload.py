@@ -4,6 +4,7 @@ from __future__ import annotations
 import hashlib
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
@@ -30,6 +31,9 @@ router = APIRouter()
 SUPPORTED_EXTS = {".txt", ".md", ".json", ".docx"}  # (PDF/.doc later)
 UNSUPPORTED_DOC_EXTS = {".doc"}  # explicitly reject with clean message
 
+# compiled once: used for every stored filename + processed output name
+UNSAFE_NAME_RE = re.compile(r"[^\w.\-]+", re.UNICODE)
+
 
 # -----------------------------
 # Response schemas
@@ -64,7 +68,7 @@ class UploadListItem(BaseModel):
 # -----------------------------
 def _safe_filename(name: str) -> str:
     name = (name or "").strip()
-    name = re.sub(r"[^\w.\-]+", "_", name, flags=re.UNICODE)
+    name = UNSAFE_NAME_RE.sub("_", name)
     return name[:180] if name else "file"
 
 
@@ -91,6 +95,16 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
+@lru_cache(maxsize=512)
+def _sha256_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Hash ήδη αποθηκευμένων uploads: κλειδί (path, mtime_ns, size), οπότε ένα
+    αμετάβλητο αρχείο δεν ξαναδιαβάζεται σε κάθε νέο upload, ενώ αλλαγή στο disk
+    ακυρώνει αυτόματα το cache.
+    """
+    return _sha256_file(Path(path))
+
+
 def _dedupe_if_exists(
     session: Session,
     user_id: int,
@@ -117,19 +131,21 @@ def _dedupe_if_exists(
     if not candidates:
         return None
 
-    new_hash = _sha256_file(new_path)
+    # lazy: το νέο αρχείο γίνεται hash μόνο αν κάποιος candidate περάσει τα φθηνά checks
+    new_hash: Optional[str] = None
 
     for up in candidates:
         try:
             p = Path(up.stored_path)
-            if not p.exists():
-                continue
             if p.suffix.lower() != suffix:
                 continue
-            if p.stat().st_size != new_size:
+            st = p.stat()  # FileNotFoundError -> continue
+            if st.st_size != new_size:
                 continue
 
-            old_hash = _sha256_file(p)
+            if new_hash is None:
+                new_hash = _sha256_file(new_path)
+            old_hash = _sha256_file_cached(str(p), st.st_mtime_ns, st.st_size)
             if old_hash == new_hash:
                 doc = session.exec(select(Document).where(Document.upload_id == up.id)).first()
                 if doc:
@@ -153,7 +169,7 @@ def _write_processed_text(upload_id: int, original_name: str, text: str) -> str:
     processed_dir.mkdir(parents=True, exist_ok=True)
 
     base = Path(original_name).stem or f"upload_{upload_id}"
-    safe_base = re.sub(r"[^\w.\-]+", "_", base, flags=re.UNICODE)[:120]
+    safe_base = UNSAFE_NAME_RE.sub("_", base)[:120]
     out_name = f"{upload_id}_{safe_base}.txt"
     out_path = processed_dir / out_name
 
@@ -177,24 +193,31 @@ def list_uploads(
     user: User = Depends(get_current_user),
 ):
     with Session(engine) as session:
-        uploads = session.exec(
-            select(Upload).where(Upload.user_id == user.id).order_by(Upload.id.desc())
+        # One round-trip (JOIN) αντί για ένα SELECT Document ανά upload (N+1).
+        # Φέρνουμε μόνο τα columns που χρειάζεται η λίστα (όχι το Document.text).
+        rows = session.exec(
+            select(Upload, Document.id, Document.parse_status, Document.parse_error)
+            .join(Document, Document.upload_id == Upload.id)
+            .where(Upload.user_id == user.id)
+            .order_by(Upload.id.desc(), Document.id.asc())
         ).all()
 
         out: list[UploadListItem] = []
-        for up in uploads:
-            doc = session.exec(select(Document).where(Document.upload_id == up.id)).first()
-            if not doc:
+        seen: set[int] = set()
+        for up, doc_id, parse_status, parse_error in rows:
+            # ένα item ανά upload (το πρώτο document του)
+            if up.id in seen:
                 continue
+            seen.add(up.id)
             out.append(
                 UploadListItem(
                     uploadId=up.id,
-                    documentId=doc.id,
+                    documentId=doc_id,
                     filename=up.filename,
                     sizeBytes=up.size_bytes,
                     contentType=up.content_type,
-                    parseStatus=getattr(doc, "parse_status", "pending"),
-                    parseError=getattr(doc, "parse_error", None),
+                    parseStatus=parse_status or "pending",
+                    parseError=parse_error,
                 )
             )
         return out
@@ -69,10 +69,25 @@ def _delete_by_upload_id(upload_id: int, user_id: int) -> dict:
 
         stored_path = up.stored_path
 
-        # Πάρε doc ids
-        rows = session.exec(
-            select(Document.id).where(Document.upload_id == upload_id, Document.user_id == user_id)
-        ).all()
+        doc_ids_q = select(Document.id).where(
+            Document.upload_id == upload_id, Document.user_id == user_id
+        )
+
+        # BULK delete segments: set-based subquery, so the DB resolves the children
+        # in one plan (no ORM cascade hydration, no huge bound IN-list of ids)
+        session.exec(sa_delete(Segment).where(Segment.document_id.in_(doc_ids_q)))
+
+        # BULK delete documents. Τα doc ids χρειάζονται μόνο για το cleanup των
+        # processed φακέλων: με RETURNING (PG, SQLite >= 3.35) έρχονται από το ίδιο
+        # statement, αλλιώς fallback σε SELECT πριν το DELETE.
+        docs_delete = sa_delete(Document).where(
+            Document.upload_id == upload_id, Document.user_id == user_id
+        )
+        if engine.dialect.delete_returning:
+            rows = session.exec(docs_delete.returning(Document.id)).all()
+        else:
+            rows = session.exec(doc_ids_q).all()
+            session.exec(docs_delete)
 
         # rows μπορεί να είναι [1,2,3] ή [(1,), (2,)] ανάλογα με setup
         doc_ids: list[int] = []
@@ -82,15 +97,6 @@ def _delete_by_upload_id(upload_id: int, user_id: int) -> dict:
             else:
                 doc_ids.append(int(getattr(r, "id", r[0])))
 
-        # BULK delete segments
-        if doc_ids:
-            session.exec(sa_delete(Segment).where(Segment.document_id.in_(doc_ids)))
-
-        # BULK delete documents
-        session.exec(
-            sa_delete(Document).where(Document.upload_id == upload_id, Document.user_id == user_id)
-        )
-
         # delete upload row
         session.exec(sa_delete(Upload).where(Upload.id == upload_id, Upload.user_id == user_id))
 
@@ -1,11 +1,28 @@
 from __future__ import annotations
+import codecs
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 from docx import Document as DocxDocument
 
 def read_text_file(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="replace")
+    """
+    Ισοδύναμο με path.read_text(encoding="utf-8", errors="replace"), αλλά με mmap:
+    ένα decode απευθείας από το mapped buffer, χωρίς ενδιάμεσο bytes copy
+    όλου του αρχείου (peak RAM ~1x αντί για ~2x σε μεγάλα αρχεία).
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # mmap δεν δέχεται κενό αρχείο
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text, _ = codecs.utf_8_decode(mm, "replace", True)
+
+    # ίδια συμπεριφορά με text mode (universal newlines)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 def parse_chatgpt_export_json(raw: str) -> str:
     """
@@ -18,66 +18,61 @@ def segment_qa(text: str) -> List[Dict[str, Any]]:
     - content (συνθετικό USER+ASSISTANT ή block)
     - start/end (ΑΚΡΙΒΕΙΣ δείκτες στο original text για highlight)
     """
+    # fast path: empty / whitespace-only -> no segments, no regex pass
+    if not text or text.isspace():
+        return []
+
     matches = list(ROLE_RE.finditer(text))
     if len(matches) < 2:
         return segment_paragraphs(text)
 
-    blocks = []
+    # only spans per block: content is sliced once, straight into its segment
+    # (no intermediate copy of every block's text)
+    blocks: List[Tuple[str, int, int, int, int]] = []
     for i, m in enumerate(matches):
         role = m.group(1).lower()
 
         block_start = m.start()  # include the "USER:" line
         block_end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
 
-        content_start_raw = m.end()
-        content_end_raw = block_end
-
-        cstart, cend = _trim_span(text, content_start_raw, content_end_raw)
-        content = text[cstart:cend]
-
-        blocks.append({
-            "role": role,
-            "content": content,
-            "block_start": block_start,
-            "block_end": block_end,
-            "content_start": cstart,
-            "content_end": cend,
-        })
+        cstart, cend = _trim_span(text, m.end(), block_end)
+        blocks.append((role, block_start, block_end, cstart, cend))
 
     segments: List[Dict[str, Any]] = []
     order = 0
     i = 0
 
     while i < len(blocks):
-        b = blocks[i]
+        role, b_start, b_end, b_cstart, b_cend = blocks[i]
 
         # Pair USER -> ASSISTANT into one Q/A segment
-        if b["role"] == "user" and i + 1 < len(blocks) and blocks[i + 1]["role"] == "assistant":
-            a = blocks[i + 1]
+        if role == "user" and i + 1 < len(blocks) and blocks[i + 1][0] == "assistant":
+            _, _, a_end, a_cstart, a_cend = blocks[i + 1]
 
             # Synthetic content (nice for reading), but span maps to original text
-            seg_content = f"USER:\n{b['content']}\n\nASSISTANT:\n{a['content']}".strip()
+            seg_content = (
+                f"USER:\n{text[b_cstart:b_cend]}\n\nASSISTANT:\n{text[a_cstart:a_cend]}"
+            ).strip()
 
             segments.append({
                 "title": f"Q/A #{order + 1}",
                 "content": seg_content,
                 # highlight the whole region in original text covering USER block + ASSISTANT block
-                "start": int(b["block_start"]),
-                "end": int(a["block_end"]),
+                "start": int(b_start),
+                "end": int(a_end),
             })
             order += 1
             i += 2
             continue
 
         # Non-paired block
-        role = b["role"]
-        seg_content = f"{role.upper()}:\n{b['content']}".strip()
+        seg_content = f"{role.upper()}:\n{text[b_cstart:b_cend]}".strip()
 
         segments.append({
             "title": f"Block #{order + 1} ({role})",
             "content": seg_content,
-            "start": int(b["block_start"]),
-            "end": int(b["block_end"]),
+            "start": int(b_start),
+            "end": int(b_end),
         })
         order += 1
         i += 1
@@ -92,6 +87,9 @@ def segment_paragraphs(text: str, max_chars: int = 2500) -> List[Dict[str, Any]]
     Paragraph chunking με ΑΚΡΙΒΗ start/end.
     Επιστρέφει chunks ως substring του original text (όχι stitched text).
     """
+    if not text or text.isspace():
+        return []
+
     paras = [(m.start(), m.end()) for m in PARA_RE.finditer(text)]
     if not paras:
         trimmed = text.strip()
@@ -6,11 +6,6 @@ from pathlib import Path
 
 from ai_organizer.core.env import DB_PATH
 
-def column_exists(conn: sqlite3.Connection, table: str, col: str) -> bool:
-    cur = conn.execute(f"PRAGMA table_info({table})")
-    cols = [row[1] for row in cur.fetchall()]  # row[1] = name
-    return col in cols
-
 def main() -> None:
     db_path = Path(DB_PATH)
     if not db_path.exists():
@@ -18,19 +13,24 @@ def main() -> None:
 
     conn = sqlite3.connect(str(db_path))
     try:
-        if not column_exists(conn, "segments", "is_manual"):
+        # one PRAGMA: same rows for the column check and the sanity print
+        rows = conn.execute("PRAGMA table_info(segments)").fetchall()
+        cols = {row[1] for row in rows}  # row[1] = name
+
+        if "is_manual" not in cols:
             print("Adding column segments.is_manual ...")
             # SQLite supports adding a column with a DEFAULT
-            conn.execute("ALTER TABLE segments ADD COLUMN is_manual INTEGER NOT NULL DEFAULT 0")
-            conn.commit()
+            with conn:  # commit on success, rollback on error
+                conn.execute("ALTER TABLE segments ADD COLUMN is_manual INTEGER NOT NULL DEFAULT 0")
             print("OK: column added.")
+            # schema changed -> re-read only in this case
+            rows = conn.execute("PRAGMA table_info(segments)").fetchall()
         else:
             print("OK: segments.is_manual already exists.")
 
         # sanity print
-        cur = conn.execute("PRAGMA table_info(segments)")
         print("\nsegments columns:")
-        for row in cur.fetchall():
+        for row in rows:
             print(row)
 
     finally: